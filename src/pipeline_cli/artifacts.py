@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Artifact:
     key: str
     description: str
@@ -15,10 +15,13 @@ DEFAULT_ARTIFACTS: list[Artifact] = [
     Artifact("worker@0.9.5", "Background worker binary"),
 ]
 
+_ARTIFACT_BY_KEY: dict[str, Artifact] = {a.key: a for a in DEFAULT_ARTIFACTS}
+_ARTIFACT_KEYS: frozenset[str] = frozenset(_ARTIFACT_BY_KEY)
+
 
 def list_artifacts() -> list[Artifact]:
     return DEFAULT_ARTIFACTS
 
 
 def artifact_exists(key: str) -> bool:
-    return any(a.key == key for a in DEFAULT_ARTIFACTS)
+    return key in _ARTIFACT_KEYS
@@ -1,26 +1,33 @@
 from __future__ import annotations
 
 import logging
-import click
-import uuid
+import secrets
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from .artifacts import artifact_exists, list_artifacts
 from .errors import ApprovalRejectedError, ArtifactNotFoundError, PipelineError
-from .logging_conf import setup_logging
-from .pipeline import PIPELINE_STEPS, run_pipeline, write_json_result
+from .logging_conf import setup_logging, stop_logging
+from .pipeline import PIPELINE_STEPS, PIPELINE_STEPS_SET, run_pipeline, write_json_result
 
 app = typer.Typer(add_completion=False, help="Simulate a delivery pipeline (artifact -> approval -> run -> logs).")
 console = Console()
 logger = logging.getLogger(__name__)
 
 
-def _render_artifacts() -> list[str]:
+@lru_cache(maxsize=1)
+def _artifact_keys() -> tuple[str, ...]:
+    return tuple(a.key for a in list_artifacts())
+
+
+def _render_artifacts() -> tuple[str, ...]:
+    # rich.table is only needed when a table is actually rendered
+    from rich.table import Table
+
     arts = list_artifacts()
     table = Table(title="Available Artifacts")
     table.add_column("#", justify="right")
@@ -29,17 +36,18 @@ def _render_artifacts() -> list[str]:
     for i, a in enumerate(arts, start=1):
         table.add_row(str(i), a.key, a.description)
     console.print(table)
-    return [a.key for a in arts]
+    return _artifact_keys()
 
 
 def _pick_artifact_interactive() -> str:
     keys = _render_artifacts()
     while True:
         choice = console.input("Select artifact ([bold]number[/bold]): ").strip()
-        if not choice.isdigit():
+        try:
+            idx = int(choice)
+        except ValueError:
             console.print("[red]Please enter a number.[/red]")
             continue
-        idx = int(choice)
         if 1 <= idx <= len(keys):
             return keys[idx - 1]
         console.print("[red]Invalid selection.[/red]")
@@ -59,6 +67,7 @@ def run(
     json_out: bool = typer.Option(True, "--json/--no-json", help="Write JSON run result next to log file"),
     simulate_seconds: float = typer.Option(0.5, "--simulate-seconds", help="Sleep per step to simulate work"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose console logs (DEBUG)"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Skip the run summary table"),
 ) -> None:
     """
     Run a simulated pipeline:
@@ -73,12 +82,13 @@ def run(
         if not artifact_exists(artifact):
             raise typer.BadParameter(f"Unknown artifact: {artifact}")
 
-    if fail_step is not None and fail_step not in PIPELINE_STEPS:
+    if fail_step is not None and fail_step not in PIPELINE_STEPS_SET:
         raise typer.BadParameter(f"--fail-step must be one of: {', '.join(PIPELINE_STEPS)}")
 
-    run_id = uuid.uuid4().hex[:12]
+    run_id = secrets.token_hex(6)
+    log_extra = {"run_id": run_id}
     log_file = setup_logging(run_id, log_dir=log_dir, verbose=verbose)
-    logger.debug("Logging initialized at %s", str(log_file), extra={"run_id": run_id})
+    logger.debug("Logging initialized at %s", str(log_file), extra=log_extra)
 
     try:
         result = run_pipeline(
@@ -88,50 +98,58 @@ def run(
             auto_yes=yes,
             fail_step=fail_step,
             simulate_seconds=simulate_seconds,
+            validated=True,
         )
 
+        json_path = log_dir / f"{result.run_id}.json"
         if json_out:
-            json_path = log_dir / f"{result.run_id}.json"
             write_json_result(result, json_path)
 
-        table = Table(title=f"Pipeline Run Summary (run_id={result.run_id})")
-        table.add_column("Step")
-        table.add_column("Status")
-        table.add_column("Message")
-        for s in result.steps:
-            table.add_row(s.name, s.status, s.message)
-        console.print(table)
+        # The summary table is only useful to a human watching the terminal
+        if console.is_terminal and not quiet:
+            from rich.table import Table
+
+            table = Table(title=f"Pipeline Run Summary (run_id={result.run_id})")
+            table.add_column("Step")
+            table.add_column("Status")
+            table.add_column("Message")
+            for s in result.steps:
+                table.add_row(s.name, s.status, s.message)
+            console.print(table)
 
         console.print(f"[green]Status:[/green] {result.status}")
         console.print(f"[green]Log file:[/green] {str(log_file)}")
         if json_out:
-            console.print(f"[green]JSON result:[/green] {str(log_dir / (result.run_id + '.json'))}")
+            console.print(f"[green]JSON result:[/green] {str(json_path)}")
 
         raise typer.Exit(code=0 if result.status == "success" else 1)
 
     except ApprovalRejectedError as e:
         console.print(f"[yellow]Rejected:[/yellow] {e}")
-        logger.warning("Run rejected by user.", extra={"run_id": run_id})
+        logger.warning("Run rejected by user.", extra=log_extra)
         raise typer.Exit(code=1)
 
     except ArtifactNotFoundError as e:
         console.print(f"[red]Error:[/red] {e}")
-        logger.error("Artifact error: %s", str(e), extra={"run_id": run_id})
+        logger.error("Artifact error: %s", str(e), extra=log_extra)
         raise typer.Exit(code=1)
 
     except PipelineError as e:
         console.print(f"[red]Pipeline error:[/red] {e}")
-        logger.error("Pipeline error: %s", str(e), extra={"run_id": run_id})
+        logger.error("Pipeline error: %s", str(e), extra=log_extra)
         raise typer.Exit(code=1)
-    
-    except click.exceptions.Exit:
-            raise
-    
+
+    except typer.Exit:
+        raise
+
     except Exception as e:
         console.print(f"[red]Unexpected error:[/red] {e}")
-        logger.exception("Unexpected error", extra={"run_id": run_id})
+        logger.exception("Unexpected error", extra=log_extra)
         raise typer.Exit(code=1)
 
+    finally:
+        stop_logging()
+
 
 def main() -> None:
     app()
@@ -1,49 +1,172 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
 from pathlib import Path
+from typing import Optional
+
+# Interval (seconds) between background flushes of the buffered log file.
+FLUSH_INTERVAL_SECONDS = 30.0
+FILE_BUFFER_SIZE = 64 * 1024
+
+# run_id of the current run; read by the shared RunIdFilter, updated by setup_logging()
+_run_id_ref: list[str] = [""]
+_file_handler: Optional["BufferedFileHandler"] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class RunIdFilter(logging.Filter):
+    """Fill in ``run_id`` on records that lack it, from a cell that setup_logging() updates."""
+
+    def __init__(self, ref: list[str]) -> None:
+        super().__init__()
+        self._ref = ref
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "run_id"):
+            record.run_id = self._ref[0]  # type: ignore[attr-defined]
+        return True
+
+
+# Built once and shared by every handler setup_logging() creates
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)sZ %(levelname)s run_id=%(run_id)s %(name)s - %(message)s",
+    datefmt="%Y-%m-%dT%H:%M:%S",
+)
+_RUN_ID_FILTER = RunIdFilter(_run_id_ref)
+
+
+class BufferedFileHandler(logging.StreamHandler):
+    """
+    File handler that lets the stream buffer writes instead of flushing per record.
+      - Flushes immediately on ERROR and above
+      - Flushes periodically from a background timer
+      - Flushes on close / interpreter exit
+    """
+
+    def __init__(self, filename: Path, buffer_size: int = FILE_BUFFER_SIZE, interval: float = FLUSH_INTERVAL_SECONDS):
+        super().__init__(open(filename, "a", buffering=buffer_size, encoding="utf-8"))
+        self._interval = interval
+        self._timer: Optional[threading.Timer] = None
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        self._timer = threading.Timer(self._interval, self._periodic_flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _periodic_flush(self) -> None:
+        self.flush()
+        if self.stream is not None and not self.stream.closed:
+            self._schedule_flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self.stream is not None and not self.stream.closed:
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self.acquire()
+        try:
+            try:
+                if self.stream is not None and not self.stream.closed:
+                    self.stream.flush()
+                    self.stream.close()
+            finally:
+                super().close()
+        finally:
+            self.release()
+
+
+def stop_logging() -> None:
+    """
+    Drain queued records into the run log file and flush it.
+    Until the next setup_logging() the file handler is attached to the root logger
+    directly, so no record is queued without a listener to consume it.
+    """
+    global _listener
+    root = logging.getLogger()
+    if _queue_handler is not None and _queue_handler in root.handlers:
+        root.removeHandler(_queue_handler)
+        if _file_handler is not None:
+            root.addHandler(_file_handler)
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _file_handler is not None:
+        _file_handler.flush()
+
+
+atexit.register(stop_logging)
 
 
 def setup_logging(run_id: str, log_dir: Path, verbose: bool = False) -> Path:
     """
     Configure root logger:
       - Console handler (INFO or DEBUG if verbose)
-      - File handler (DEBUG)
+      - File handler (DEBUG, buffered), fed by a queue listener on a worker thread
     Returns the created log file path.
     """
+    global _file_handler, _queue_handler, _listener
+
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / f"{run_id}.log"
 
+    # Console handler
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.DEBUG if verbose else logging.INFO)
+    ch.setFormatter(_FORMATTER)
+    ch.addFilter(_RUN_ID_FILTER)
+
+    # File handler (opened before the previous run's handlers are torn down)
+    fh = BufferedFileHandler(log_file)
+    fh.setLevel(logging.DEBUG)
+    fh.setFormatter(_FORMATTER)
+    fh.addFilter(_RUN_ID_FILTER)
+
+    # Queue handler: callers only enqueue, the listener thread writes the log file.
+    # run_id is stamped at enqueue time so the record carries it through the queue.
+    q: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    qh = logging.handlers.QueueHandler(q)
+    qh.addFilter(_RUN_ID_FILTER)
+
     root = logging.getLogger()
     root.setLevel(logging.DEBUG)
 
     # Avoid duplicate handlers (important in tests / repeated runs)
+    stop_logging()
     for h in list(root.handlers):
         root.removeHandler(h)
+    if _file_handler is not None:
+        _file_handler.close()
 
-    fmt = logging.Formatter(
-        fmt="%(asctime)sZ %(levelname)s run_id=%(run_id)s %(name)s - %(message)s",
-        datefmt="%Y-%m-%dT%H:%M:%S",
-    )
-
-    class RunIdFilter(logging.Filter):
-        def filter(self, record: logging.LogRecord) -> bool:
-            if not hasattr(record, "run_id"):
-                record.run_id = run_id  # type: ignore[attr-defined]
-            return True
-
-    # Console handler
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.DEBUG if verbose else logging.INFO)
-    ch.setFormatter(fmt)
-    ch.addFilter(RunIdFilter())
+    # Only switch run_id once the previous run's records are drained and the new file is open
+    _run_id_ref[0] = run_id
     root.addHandler(ch)
+    root.addHandler(qh)
 
-    # File handler
-    fh = logging.FileHandler(log_file, encoding="utf-8")
-    fh.setLevel(logging.DEBUG)
-    fh.setFormatter(fmt)
-    fh.addFilter(RunIdFilter())
-    root.addHandler(fh)
+    _file_handler = fh
+    _queue_handler = qh
+    _listener = logging.handlers.QueueListener(q, fh, respect_handler_level=True)
+    _listener.start()
 
     return log_file
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Literal
 
@@ -9,11 +9,15 @@ StepStatus = Literal["success", "failed", "skipped"]
 RunStatus = Literal["success", "failed", "rejected"]
 
 
+_UTC = timezone.utc
+_now = datetime.now
+
+
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    return _now(_UTC).isoformat()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepResult:
     name: str
     status: StepStatus
@@ -21,8 +25,17 @@ class StepResult:
     finished_at: str
     message: str = ""
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "message": self.message,
+        }
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunResult:
     run_id: str
     artifact: str
@@ -33,4 +46,12 @@ class RunResult:
     steps: list[StepResult]
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "run_id": self.run_id,
+            "artifact": self.artifact,
+            "approved": self.approved,
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "steps": [s.to_dict() for s in self.steps],
+        }
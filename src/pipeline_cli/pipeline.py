@@ -6,13 +6,23 @@ import time
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None  # type: ignore[assignment]
+
 from .artifacts import artifact_exists
 from .errors import ApprovalRejectedError, ArtifactNotFoundError
 from .models import RunResult, StepResult, utc_now_iso
 
 logger = logging.getLogger(__name__)
 
+JSON_BUFFER_SIZE = 64 * 1024
+
 PIPELINE_STEPS = ["build", "test", "package", "deploy"]
+PIPELINE_STEPS_SET: frozenset[str] = frozenset(PIPELINE_STEPS)
+STEP_INDEX: dict[str, int] = {s: i for i, s in enumerate(PIPELINE_STEPS)}
+REMAINING_AFTER: dict[str, tuple[str, ...]] = {s: tuple(PIPELINE_STEPS[i + 1 :]) for s, i in STEP_INDEX.items()}
 
 
 def require_approval(prompt: str = "Approve deployment? (y/N): ", auto_yes: bool = False) -> bool:
@@ -29,35 +39,40 @@ def run_pipeline(
     auto_yes: bool,
     fail_step: Optional[str],
     simulate_seconds: float,
+    validated: bool = False,
 ) -> RunResult:
     started_at = utc_now_iso()
-    logger.info("Run started. artifact=%s", artifact, extra={"run_id": run_id})
+    log_extra = {"run_id": run_id}
+    logger.info("Run started. artifact=%s", artifact, extra=log_extra)
 
-    if not artifact_exists(artifact):
-        logger.error("Unknown artifact: %s", artifact, extra={"run_id": run_id})
+    # Callers that already checked the artifact (e.g. the CLI) can skip the lookup
+    if not validated and not artifact_exists(artifact):
+        logger.error("Unknown artifact: %s", artifact, extra=log_extra)
         raise ArtifactNotFoundError(f"Unknown artifact: {artifact}")
 
     approved = True
     if require_manual_approval:
-        logger.info("Waiting for manual approval...", extra={"run_id": run_id})
+        logger.info("Waiting for manual approval...", extra=log_extra)
         approved = require_approval(auto_yes=auto_yes)
         if not approved:
-            logger.warning("Approval rejected.", extra={"run_id": run_id})
+            logger.warning("Approval rejected.", extra=log_extra)
             raise ApprovalRejectedError("Approval rejected by user.")
 
     step_results: list[StepResult] = []
     overall_status = "success"
+    delay = max(0.0, simulate_seconds)
 
     for step in PIPELINE_STEPS:
         step_start = utc_now_iso()
-        logger.info("Step started: %s", step, extra={"run_id": run_id})
+        step_clock = time.perf_counter()
 
-        time.sleep(max(0.0, simulate_seconds))
+        if delay:
+            time.sleep(delay)
 
         if fail_step and step == fail_step:
             step_end = utc_now_iso()
             msg = f"Simulated failure at step '{step}'."
-            logger.error(msg, extra={"run_id": run_id})
+            logger.error(msg, extra=log_extra)
             step_results.append(
                 StepResult(
                     name=step,
@@ -70,7 +85,7 @@ def run_pipeline(
             overall_status = "failed"
 
             # Remaining steps are skipped
-            for remaining in PIPELINE_STEPS[PIPELINE_STEPS.index(step) + 1 :]:
+            for remaining in REMAINING_AFTER[step]:
                 now = utc_now_iso()
                 step_results.append(
                     StepResult(
@@ -93,7 +108,9 @@ def run_pipeline(
                 message="OK",
             )
         )
-        logger.info("Step finished: %s (success)", step, extra={"run_id": run_id})
+        logger.info(
+            "step=%s status=success elapsed=%.3fs", step, time.perf_counter() - step_clock, extra=log_extra
+        )
 
     finished_at = utc_now_iso()
     result = RunResult(
@@ -105,13 +122,15 @@ def run_pipeline(
         finished_at=finished_at,
         steps=step_results,
     )
-    logger.info("Run finished. status=%s", result.status, extra={"run_id": run_id})
+    logger.info("Run finished. status=%s", result.status, extra=log_extra)
     return result
 
 
 def write_json_result(result: RunResult, out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        json.dumps(result.to_dict(), indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    if orjson is not None:
+        out_path.write_bytes(orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
+    with out_path.open("w", encoding="utf-8", buffering=JSON_BUFFER_SIZE) as fp:
+        json.dump(result.to_dict(), fp, indent=2, ensure_ascii=False)
+        fp.write("\n")
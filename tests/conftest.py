@@ -0,0 +1,19 @@
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+# Import the package the same way run.py does
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.pipeline_cli import logging_conf  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def reset_logging():
+    yield
+    logging_conf.stop_logging()
+    root = logging.getLogger()
+    for h in list(root.handlers):
+        root.removeHandler(h)
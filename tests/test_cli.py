@@ -0,0 +1,70 @@
+import logging
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from src.pipeline_cli.cli import app
+
+runner = CliRunner()
+
+
+def _invoke(log_dir: Path):
+    return runner.invoke(
+        app,
+        ["--artifact", "api-service@1.0.0", "--yes", "--simulate-seconds", "0", "--log-dir", str(log_dir)],
+    )
+
+
+def _new_log(log_dir: Path, seen: set[Path]) -> Path:
+    (log_file,) = set(log_dir.glob("*.log")) - seen
+    seen.add(log_file)
+    return log_file
+
+
+def test_repeated_runs_log_to_console_and_own_file(tmp_path: Path) -> None:
+    seen: set[Path] = set()
+    for _ in range(3):
+        result = _invoke(tmp_path)
+        assert result.exit_code == 0, result.output
+        assert "Logging error" not in result.output
+        assert "Run finished. status=success" in result.output
+        assert "Unexpected error" not in result.output
+
+        log_file = _new_log(tmp_path, seen)
+        run_id = log_file.stem
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert any("Run finished. status=success" in line for line in lines)
+        assert all(f"run_id={run_id} " in line for line in lines)
+
+
+def test_record_logged_between_runs_stays_in_previous_run_log(tmp_path: Path) -> None:
+    seen: set[Path] = set()
+    assert _invoke(tmp_path).exit_code == 0
+    first_log = _new_log(tmp_path, seen)
+
+    logging.getLogger("tests").warning("after-run message")
+
+    assert _invoke(tmp_path).exit_code == 0
+    second_log = _new_log(tmp_path, seen)
+
+    assert f"run_id={first_log.stem} tests - after-run message" in first_log.read_text(encoding="utf-8")
+    assert "after-run message" not in second_log.read_text(encoding="utf-8")
+
+
+def test_failed_setup_keeps_previous_logging(tmp_path: Path) -> None:
+    seen: set[Path] = set()
+    log_dir = tmp_path / "logs"
+    assert _invoke(log_dir).exit_code == 0
+    first_log = _new_log(log_dir, seen)
+
+    not_a_dir = tmp_path / "not-a-dir"
+    not_a_dir.write_text("", encoding="utf-8")
+    assert _invoke(not_a_dir).exit_code != 0
+
+    logging.getLogger("tests").warning("after failed setup")
+
+    assert _invoke(log_dir).exit_code == 0
+    second_log = _new_log(log_dir, seen)
+
+    assert f"run_id={first_log.stem} tests - after failed setup" in first_log.read_text(encoding="utf-8")
+    assert "after failed setup" not in second_log.read_text(encoding="utf-8")